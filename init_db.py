@@ -1,74 +1,85 @@
 """
 Database Initialization for PAN
 
-This script initializes the PAN database with the necessary tables.
+This script initializes the PAN database with the necessary tables. It is
+the single source of the schema: pan_core reuses initialize_database()
+from here, so it also runs standalone as a bootstrap script.
 """
 
-# pylint: disable=duplicate-code
-# The duplication with pan_core.py and version.py is intentional
-# as this is a standalone bootstrap script
-
 import sqlite3
 
 from pan_config import DATABASE_PATH
 
 
-def initialize_database():
+# Connection settings applied before creating the schema. synchronous=NORMAL
+# is safe under WAL and avoids an fsync on every commit.
+INIT_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+# Complete schema, created in a single batch by initialize_database
+SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS memories (
+    id INTEGER PRIMARY KEY,
+    category TEXT,
+    content TEXT
+);
+CREATE TABLE IF NOT EXISTS opinions (
+    id INTEGER PRIMARY KEY,
+    topic TEXT,
+    opinion TEXT,
+    strength INTEGER
+);
+CREATE TABLE IF NOT EXISTS affinity (
+    user_id TEXT PRIMARY KEY,
+    score INTEGER
+);
+CREATE TABLE IF NOT EXISTS news_archive (
+    id INTEGER PRIMARY KEY,
+    headline TEXT,
+    date TEXT
+);
+"""
+
+
+def initialize_database(verbose=True):
     """
     Initialize the SQLite database with all required tables.
+
+    Creates the database and necessary tables if they don't already exist.
+    Tables include:
+    - users: Store user information
+    - memories: Store PAN's memories and knowledge
+    - opinions: Store PAN's opinions on various topics
+    - affinity: Store relationship scores with different users
+    - news_archive: Cache news information to avoid redundant notifications
+
+    The whole schema is executed as one script inside a single transaction,
+    so SQLite parses and commits it in one pass instead of once per table.
+
+    Args:
+        verbose (bool): Whether to print status messages during initialization
     """
-    print(f"Initializing database at {DATABASE_PATH}...")
-
-    with sqlite3.connect(DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-
-        # Users table
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS users (
-            user_id TEXT PRIMARY KEY,
-            name TEXT NOT NULL
-        )"""
-        )
-
-        # Memories table
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS memories (
-            id INTEGER PRIMARY KEY,
-            category TEXT,
-            content TEXT
-        )"""
-        )
-
-        # Opinions table
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS opinions (
-            id INTEGER PRIMARY KEY,
-            topic TEXT,
-            opinion TEXT,
-            strength INTEGER
-        )"""
-        )
-
-        # Affinity table
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS affinity (
-            user_id TEXT PRIMARY KEY,
-            score INTEGER
-        )"""
-        )
-
-        # News archive table
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS news_archive (
-            id INTEGER PRIMARY KEY,
-            headline TEXT,
-            date TEXT
-        )"""
-        )
-
-        conn.commit()
-
-    print("Database initialization complete!")
+    if verbose:
+        print(f"Initializing database at {DATABASE_PATH}...")
+
+    # Autocommit mode: the script below manages its own transaction
+    with sqlite3.connect(DATABASE_PATH, isolation_level=None) as conn:
+        for pragma in INIT_PRAGMAS:
+            conn.execute(pragma)
+
+        # Create all tables in one batch
+        conn.executescript("BEGIN;" + SCHEMA_SQL + "COMMIT;")
+
+    if verbose:
+        print("Database initialization complete!")
 
 
 if __name__ == "__main__":
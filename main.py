@@ -5,28 +5,32 @@ Main entry point for the PAN digital assistant. Handles initialization,
 user interaction, command processing, and manages the autonomous curiosity system.
 """
 
+import platform
+import queue
 import random
+import re
+import signal
 import threading
 import time
-from datetime import datetime
 
 import pan_config  # Centralized Configuration
-import pan_conversation
-import pan_core
-import pan_research
 import pan_speech
 
+# pan_ai, pan_core, pan_conversation and pan_research are imported where they
+# are first needed, so importing this module stays cheap.
+
 
 # App state management class
 class PanState:
     """Class to manage PAN application state"""
 
     # State variables
-    curiosity_active = True
-    last_interaction_time = time.time()
-    last_speech_time = 0
+    shutdown_event = threading.Event()  # Set when PAN is shutting down
+    last_interaction_time = time.monotonic()  # Monotonic clock, for idle tracking
+    last_speech_time = 0.0
 
     # Configuration settings with defaults
+    ASSISTANT_NAME = "Pan"
     MAX_SHORT_TERM_MEMORY = 10
     IDLE_THRESHOLD_SECONDS = 300  # 5 minutes
     MIN_SPEECH_INTERVAL_SECONDS = 15
@@ -35,6 +39,7 @@ class PanState:
     def load_config(cls):
         """Load configuration settings from config module"""
         config = pan_config.get_config()
+        cls.ASSISTANT_NAME = config["assistant"]["name"]
         cls.MAX_SHORT_TERM_MEMORY = config["conversation"]["max_short_term_memory"]
         cls.IDLE_THRESHOLD_SECONDS = config["conversation"]["idle_threshold_seconds"]
         cls.MIN_SPEECH_INTERVAL_SECONDS = config["conversation"][
@@ -45,6 +50,38 @@ class PanState:
 # Initialize configuration
 PanState.load_config()
 
+# Spoken command that shuts PAN down
+EXIT_COMMAND_RE = re.compile(r"\bexit\s+program\b", re.IGNORECASE)
+
+# Host platform, looked up once
+PLATFORM = platform.system()
+
+# Seconds after PAN stops talking during which a new capture may still be
+# its own voice echoing back through the microphone
+ECHO_WINDOW_SECONDS = 0.3
+
+# Topics PAN researches on its own when left idle
+CURIOSITY_TOPICS = ("space", "history", "technology", "science")
+
+
+def _greeting_for_hour(hour):
+    if 5 <= hour < 12:
+        return "Good morning!"
+    if 12 <= hour < 17:
+        return "Good afternoon!"
+    if 17 <= hour < 22:
+        return "Good evening!"
+    return "Hello!"
+
+
+# Greeting for each hour of the day, indexed by local hour
+GREETING_BY_HOUR = tuple(_greeting_for_hour(hour) for hour in range(24))
+
+# Spoken once on startup, filled in by build_startup_greeting()
+STARTUP_GREETING = (
+    "{greeting} I'm {name}, ready to help you. How can I assist you today?"
+)
+
 
 def check_macos_microphone_permissions():
     """
@@ -54,17 +91,13 @@ def check_macos_microphone_permissions():
     permissions are denied. This function should be called on startup
     when running on macOS.
     """
-    import platform
-
-    import speech_recognition as sr
-
-    if platform.system() != "Darwin":
+    if PLATFORM != "Darwin":
         # Not macOS, no need to check
         return
 
     try:
-        # Try to list available microphones
-        microphones = sr.Microphone.list_microphone_names()
+        # Enumerate microphones once; pan_speech caches the result for later use
+        microphones = pan_speech.list_microphones()
         if not microphones:
             print("\n" + "=" * 50)
             print("MACOS MICROPHONE PERMISSION ALERT")
@@ -84,77 +117,184 @@ def check_macos_microphone_permissions():
         print("=" * 50 + "\n")
 
 
+def build_startup_greeting(name):
+    """
+    Build the full greeting PAN speaks on startup.
+
+    Args:
+        name (str): The assistant's name
+
+    Returns:
+        str: The greeting text
+    """
+    return STARTUP_GREETING.format(greeting=get_time_based_greeting(), name=name)
+
+
 def get_time_based_greeting():
-    hour = datetime.now().hour
-    if 5 <= hour < 12:
-        return "Good morning!"
-    if 12 <= hour < 17:
-        return "Good afternoon!"
-    if 17 <= hour < 22:
-        return "Good evening!"
-    return "Hello!"
+    """Return a greeting appropriate for the current hour of the day"""
+    return GREETING_BY_HOUR[time.localtime().tm_hour]
+
 
+def curiosity_tick(now):
+    """
+    Perform a curiosity action if PAN has been idle long enough.
+
+    Called from the main loop whenever a round of listening ends without
+    input, so curiosity shares the main loop's wake-ups instead of running
+    its own polling thread.
 
-def curiosity_loop():
-    """Background thread to periodically perform curiosity actions when idle"""
+    Args:
+        now (float): Current time from time.monotonic()
 
-    while PanState.curiosity_active:
-        time.sleep(10)
-        idle_time = time.time() - PanState.last_interaction_time
+    Returns:
+        bool: True if a curiosity action was performed
+    """
+    if now - PanState.last_interaction_time < PanState.IDLE_THRESHOLD_SECONDS:
+        return False
 
-        if idle_time >= PanState.IDLE_THRESHOLD_SECONDS:
-            topic = random.choice(["space", "history", "technology", "science"])
-            search_result = pan_research.live_search(topic)
-            pan_speech.speak(
-                f"I just learned something amazing about {topic}! {search_result}"
-            )
+    import pan_research
 
-            # Update timestamps
-            PanState.last_speech_time = time.time()
-            PanState.last_interaction_time = time.time()
+    topic = random.choice(CURIOSITY_TOPICS)
+    search_result = pan_research.live_search(topic)
+    pan_speech.speak(f"I just learned something amazing about {topic}! {search_result}")
+
+    # Update timestamps
+    PanState.last_speech_time = time.monotonic()
+    PanState.last_interaction_time = PanState.last_speech_time
+    return True
 
 
 def listen_with_retries(max_attempts=3, timeout=5):
+    """
+    Listen for user speech, retrying a few times.
+
+    Listening carries on while PAN is speaking, so the user can interrupt it.
+    A capture that overlaps PAN's own speech, or starts within
+    ECHO_WINDOW_SECONDS of it ending, may just be PAN hearing itself, so only
+    stop commands are kept from such captures.
+
+    Args:
+        max_attempts (int): Number of listen attempts before giving up
+        timeout (int): Seconds to wait for speech to start on each attempt
+
+    Returns:
+        str or None: The recognized text, or None if nothing usable was heard
+    """
+    import pan_conversation
+
+    shutdown_event = PanState.shutdown_event
+    listen_to_user = pan_speech.listen_to_user
+    speak_manager = pan_speech.speak_manager
+
     for attempt in range(max_attempts):
-        text = pan_speech.listen_to_user(timeout=timeout)
+        if shutdown_event.is_set():
+            break
+        utterances_before = speak_manager.utterance_count
+        overlaps_speech = (
+            not speak_manager.wait_until_idle(timeout=0)
+            or time.monotonic() - speak_manager.idle_since < ECHO_WINDOW_SECONDS
+        )
+        text = listen_to_user(timeout=timeout)
+        if speak_manager.utterance_count != utterances_before:
+            overlaps_speech = True  # PAN started talking while we listened
+        if text and overlaps_speech and not pan_conversation.is_stop_command(text):
+            print("Discarding input that overlapped with PAN speaking.")
+            text = None
         if text:
             return text
         print(f"Listen attempt {attempt + 1} failed, retrying...")
-        time.sleep(1)
+        if shutdown_event.wait(timeout=1):
+            break
     return None
 
 
-if __name__ == "__main__":
+def listen_worker(transcripts):
+    """
+    Producer thread of the listen -> respond -> speak pipeline.
+
+    Keeps listening in the background and puts each transcript on
+    ``transcripts``, so the next utterance is captured while the main thread
+    is still generating or speaking a reply. Stop commands interrupt PAN
+    straight away. Puts None after a round of failed attempts so the
+    consumer can do idle work.
+
+    Args:
+        transcripts (queue.Queue): Queue consumed by the main loop
+    """
+    import pan_conversation
+
+    while not PanState.shutdown_event.is_set():
+        text = listen_with_retries()
+        if text and pan_conversation.is_stop_command(text):
+            # Act now rather than after the reply currently being generated
+            pan_conversation.interrupt()
+        transcripts.put(text)
+
+
+def handle_exit_signal(signum, _frame):
+    """
+    Request a clean shutdown when PAN receives SIGINT or SIGTERM.
+
+    Sets the shared shutdown event, which wakes every waiting loop at once.
+    A second Ctrl+C falls back to the default handler and exits immediately.
+    """
+    print(f"\nReceived signal {signum}, shutting down...")
+    PanState.shutdown_event.set()
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+
+def main():
+    """
+    Run the PAN assistant.
+
+    Initializes the core systems, greets the user and then processes spoken
+    input until the user asks to exit, exploring topics on its own when idle.
+    """
+    import pan_ai
+    import pan_conversation
+    import pan_core
+
+    signal.signal(signal.SIGINT, handle_exit_signal)
+    signal.signal(signal.SIGTERM, handle_exit_signal)
+
     print("Pan is starting...")
     pan_core.initialize_pan()
-    greeting = get_time_based_greeting()
-    pan_speech.speak(
-        f"{greeting} I'm Pan, ready to help you. How can I assist you today?"
-    )
 
-    curiosity_thread = threading.Thread(target=curiosity_loop, daemon=True)
-    curiosity_thread.start()
+    # Load the language model in the background while the greeting is spoken
+    threading.Thread(target=pan_ai.PanAI.get_instance, daemon=True).start()
+    pan_speech.speak(build_startup_greeting(PanState.ASSISTANT_NAME))
 
     user_id = "default_user"
 
-    while True:
-        user_input = listen_with_retries()
-        if user_input:
-            user_input_lower = user_input.lower()
+    # Listening runs on its own thread so it overlaps with response generation
+    transcripts: queue.Queue = queue.Queue()
+    threading.Thread(target=listen_worker, args=(transcripts,), daemon=True).start()
 
-            if "exit program" in user_input_lower:
+    while not PanState.shutdown_event.is_set():
+        try:
+            user_input = transcripts.get(timeout=1)
+        except queue.Empty:
+            continue
+        if user_input:
+            if EXIT_COMMAND_RE.search(user_input):
                 pan_speech.speak("Goodbye! Shutting down now.")
-                PanState.curiosity_active = False
-                curiosity_thread.join(timeout=5)
+                # Let the farewell finish before the daemon speech thread dies
+                pan_speech.speak_manager.wait_until_idle(timeout=5)
+                PanState.shutdown_event.set()
                 break
 
             # Update interaction time
-            PanState.last_interaction_time = time.time()
+            PanState.last_interaction_time = time.monotonic()
 
-            # Process the user input
+            # Process the user input; respond() speaks the reply itself,
+            # streaming it sentence by sentence for model-generated replies
             response = pan_conversation.respond(user_input, user_id)
+            if response:
+                print(f"Pan: {response}")
+        elif not PanState.shutdown_event.is_set():
+            if not curiosity_tick(time.monotonic()):
+                print("No valid input detected, listening again...")
 
-            print(f"Pan: {response}")
-            pan_speech.speak(response)
-        else:
-            print("No valid input detected, listening again...")
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,47 @@ Language Model Interface for PAN
 
 This module provides a wrapper around transformer-based language models,
 allowing PAN to generate natural language responses. It uses the Hugging Face
-transformers library to load and run inference with pre-trained language models.
+transformers library to load and run inference with pre-trained language models,
+or llama.cpp with a quantized GGUF model when LLM_GGUF_PATH is configured.
 """
 
+import os
+import threading
+from importlib.util import find_spec
+
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from transformers import (
+    AutoModelForCausalLM,
+    AutoTokenizer,
+    GenerationConfig,
+    StoppingCriteria,
+    StoppingCriteriaList,
+    TextIteratorStreamer,
+)
+
+from pan_config import (
+    COMPILE_MODEL,
+    DRAFT_MODEL_NAME,
+    LLM_GGUF_PATH,
+    MODEL_CONTEXT_LENGTH,
+    MODEL_QUANTIZATION_LEVEL,
+)
+from pan_utils import create_quantization_config
+
+# Let the CUDA caching allocator grow segments in place instead of fragmenting
+# as the key/value cache grows every turn. PyTorch reads this on the first CUDA
+# allocation, so it only has to be set before the model is loaded.
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True")
+
+# Import llama.cpp bindings conditionally for the quantized GGUF backend
+try:
+    from llama_cpp import Llama
+except ImportError:
+    Llama = None  # llama-cpp-python not installed - GGUF backend unavailable
+
+# Each history entry is one line, so a reply ends at the newline; without
+# this, generation runs on into made-up follow-up turns. Used by both backends.
+REPLY_STOP_STRINGS = ["\n"]
 
 
 class PanAI:
@@ -16,25 +52,214 @@ class PanAI:
 
     This class handles the loading, initialization, and inference of
     transformer-based language models to generate human-like text responses.
+    Loading the model is expensive, so use get_instance() to share a single,
+    lazily created instance.
     """
 
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls):
+        """
+        Return the shared PanAI instance, loading the model on first use.
+
+        Safe to call from several threads; the model is only loaded once.
+
+        Returns:
+            PanAI: The shared instance
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def reset_loaded_context(cls):
+        """Drop the shared instance's cached key/values, if it is loaded."""
+        instance = cls._instance
+        if instance is not None:
+            instance.reset_context()
+
     def __init__(self):
         """
         Initialize the language model and tokenizer.
 
-        Dynamically selects GPU (CUDA) with BitsAndBytes if available,
-        otherwise falls back to CPU (standard precision).
+        Dynamically selects GPU (CUDA), quantized with BitsAndBytes when
+        MODEL_QUANTIZATION_LEVEL is 4bit or 8bit, otherwise falls back to CPU
+        (standard precision). If LLM_GGUF_PATH is set and llama-cpp-python is
+        installed, an INT4/INT8 GGUF model is loaded through llama.cpp instead.
         """
         self.model_name = "EleutherAI/gpt-neo-1.3B"  # Smaller, faster model
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 
+        # Key/value cache of the previous call, reused when the next prompt
+        # extends it (the conversation history only grows between turns)
+        self._generate_lock = threading.Lock()
+        self._past_key_values = None
+        self._cached_ids = None
+
+        self.llm = None
+        self.draft_model = None
+        if LLM_GGUF_PATH:
+            if Llama is not None:
+                self._load_gguf_model()
+                return
+            print(
+                "Warning: LLM_GGUF_PATH is set but llama-cpp-python is not installed. "
+                "Falling back to the transformers model."
+            )
+
         self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        # Overlong prompts lose their oldest history, not the "PAN:" cue
+        self.tokenizer.truncation_side = "left"
+        # Sampling settings shared by every call, built and validated once
+        self.generation_config = GenerationConfig(
+            num_return_sequences=1,
+            do_sample=True,  # Allow sampling (needed for temperature)
+            temperature=0.7,  # Control randomness (lower is more deterministic)
+            no_repeat_ngram_size=2,  # Prevent repetition of n-grams
+            use_cache=True,
+            return_dict_in_generate=True,
+            pad_token_id=self.tokenizer.eos_token_id,  # GPT-Neo has no pad token
+            eos_token_id=self.tokenizer.eos_token_id,
+            stop_strings=REPLY_STOP_STRINGS,
+        )
+        load_kwargs = {"torch_dtype": self._model_dtype()}
+        quantization_config = None
+        if self.device.type == "cuda":
+            # Weight-only INT8/INT4 roughly halves (or quarters) the weight
+            # bytes read per decoded token; activations stay in half precision
+            quantization_config, _ = create_quantization_config(
+                MODEL_QUANTIZATION_LEVEL
+            )
+        if quantization_config is not None:
+            # bitsandbytes places the quantized weights itself
+            load_kwargs["quantization_config"] = quantization_config
+            load_kwargs["device_map"] = {"": self.device}
+        elif find_spec("accelerate") is not None:
+            # Load the weights straight onto the device instead of building a
+            # full copy in CPU memory first, which roughly halves peak RAM
+            load_kwargs["low_cpu_mem_usage"] = True
+            load_kwargs["device_map"] = {"": self.device}
+        if self.device.type == "cuda" and find_spec("flash_attn") is not None:
+            # Fused attention kernels that never materialise the full
+            # attention matrix; needs the half-precision weights chosen above
+            load_kwargs["attn_implementation"] = "flash_attention_2"
         self.model = AutoModelForCausalLM.from_pretrained(
-            self.model_name,
-            torch_dtype=torch.float16 if self.device.type == "cuda" else torch.float32,
+            self.model_name, **load_kwargs
         )
-        self.model.to(self.device)
+        if "device_map" not in load_kwargs:
+            self.model.to(self.device)
         self.model.eval()  # Set the model to evaluation mode
+        self.model.requires_grad_(False)  # Inference only, never track gradients
+        self.context_length = min(
+            MODEL_CONTEXT_LENGTH, self.model.config.max_position_embeddings
+        )
+        if self.device.type == "cpu" and MODEL_QUANTIZATION_LEVEL.lower() == "8bit":
+            self._quantize_for_cpu()
+        elif COMPILE_MODEL:
+            self._compile_model()
+        if DRAFT_MODEL_NAME:
+            self._load_draft_model()
+
+    def _model_dtype(self):
+        """
+        Pick the weight dtype for the device.
+
+        Half precision halves the bytes streamed per decoded token on GPU.
+        bfloat16 is preferred where supported (Ampere and newer) since it has
+        the range of float32 and avoids fp16 overflow; CPUs stay on float32,
+        where half precision is usually slower.
+        """
+        if self.device.type != "cuda":
+            return torch.float32
+        if torch.cuda.is_bf16_supported():
+            return torch.bfloat16
+        return torch.float16
+
+    def _load_gguf_model(self):
+        """
+        Load a quantized GGUF model with llama.cpp.
+
+        llama.cpp keeps its own key/value cache and reuses the longest common
+        prompt prefix between calls, so no extra caching is needed here.
+        """
+        self.model_name = LLM_GGUF_PATH
+        self.llm = Llama(
+            model_path=LLM_GGUF_PATH,
+            n_ctx=MODEL_CONTEXT_LENGTH,
+            n_threads=os.cpu_count(),
+            n_gpu_layers=-1 if self.device.type == "cuda" else 0,
+            verbose=False,
+        )
+        print(f"Loaded GGUF model with llama.cpp: {LLM_GGUF_PATH}")
+
+    def _load_draft_model(self):
+        """
+        Load the small draft model used for speculative (assisted) decoding.
+
+        The draft model proposes several tokens per step and the main model
+        verifies them in a single forward pass, so output quality is the
+        same as without it. It must share the main model's tokenizer
+        (e.g. EleutherAI/gpt-neo-125m for gpt-neo-1.3B).
+        """
+        self.draft_model = AutoModelForCausalLM.from_pretrained(
+            DRAFT_MODEL_NAME, torch_dtype=self._model_dtype()
+        )
+        self.draft_model.to(self.device)
+        self.draft_model.eval()
+        self.draft_model.requires_grad_(False)
+        print(f"Loaded draft model for speculative decoding: {DRAFT_MODEL_NAME}")
+
+    def _quantize_for_cpu(self):
+        """
+        Quantize the model's linear layers to INT8 for CPU inference.
+
+        Uses PyTorch's dynamic quantization: weights are stored as INT8 and
+        activations are quantized on the fly, which speeds up the linear
+        layers that dominate decoding on CPUs with VNNI/AVX2 support.
+        """
+        self.model = torch.ao.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        print("Quantized model linear layers to INT8 for CPU inference")
+
+    def _compile_model(self):
+        """
+        Compile the model's forward pass to cut per-token launch overhead.
+
+        Only the forward is compiled, so model.generate() keeps working and
+        calls the compiled version for every decoding step. Inductor fuses
+        the elementwise ops into Triton kernels on CUDA and vectorised C++
+        kernels on CPU. CUDA graphs ("reduce-overhead") are left off: the
+        KV cache grows every step, so the graphs would be re-recorded.
+        """
+        if not hasattr(torch, "compile"):
+            print("Warning: torch.compile is not available, using eager mode.")
+            return
+        if self.device.type == "cuda":
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.set_float32_matmul_precision("high")
+        self.model.forward = torch.compile(
+            self.model.forward, mode="default", dynamic=True
+        )
+        print("Compiled model forward pass with torch.compile")
+
+    def reset_context(self):
+        """Drop the cached key/values, e.g. when the conversation is reset."""
+        with self._generate_lock:
+            self._past_key_values = None
+            self._cached_ids = None
+
+    def _reusable_cache(self, input_ids):
+        """Return the cached key/values if they cover a prefix of input_ids."""
+        cached_ids = self._cached_ids
+        if cached_ids is None or cached_ids.shape[1] >= input_ids.shape[1]:
+            return None
+        if not torch.equal(input_ids[:, : cached_ids.shape[1]], cached_ids):
+            return None
+        return self._past_key_values
 
     def generate_response(self, prompt, max_new_tokens=150):
         """
@@ -45,20 +270,161 @@ class PanAI:
             max_new_tokens (int, optional): Maximum length of the generated response
 
         Returns:
-            str: The generated text response
+            str: The generated text response, without the prompt
         """
-        inputs = self.tokenizer(prompt, return_tensors="pt").to(self.device)
-        outputs = self.model.generate(
-            **inputs,
-            max_new_tokens=max_new_tokens,
-            num_return_sequences=1,
-            do_sample=True,  # Allow sampling (needed for temperature)
-            temperature=0.7,  # Control randomness (lower is more deterministic)
-            no_repeat_ngram_size=2,  # Prevent repetition of n-grams
+        if self.llm is not None:
+            with self._generate_lock:
+                result = self.llm(
+                    self._encode_for_llama(prompt, max_new_tokens),
+                    max_tokens=max_new_tokens,
+                    temperature=0.7,
+                    stop=REPLY_STOP_STRINGS,
+                )
+            return result["choices"][0]["text"].strip()
+
+        inputs = self._encode(prompt, max_new_tokens)
+        with self._generate_lock:
+            sequences = self._generate(inputs, max_new_tokens)
+        # Decode only the new tokens rather than decoding and then stripping the prompt
+        new_tokens = sequences[0, inputs["input_ids"].shape[1] :]
+        return self.tokenizer.decode(new_tokens, skip_special_tokens=True).strip()
+
+    def stream_response(self, prompt, max_new_tokens=150, stop_event=None):
+        """
+        Generate a response, yielding text pieces as soon as they are decoded.
+
+        Generation runs on a background thread so the caller can start
+        speaking the first sentence while the rest is still being generated.
+
+        Args:
+            prompt (str): The input text to generate a response from
+            max_new_tokens (int, optional): Maximum length of the generated response
+            stop_event (threading.Event, optional): Ends generation early when set
+
+        Yields:
+            str: The next piece of generated text
+        """
+        if self.llm is not None:
+            with self._generate_lock:
+                for chunk in self.llm(
+                    self._encode_for_llama(prompt, max_new_tokens),
+                    max_tokens=max_new_tokens,
+                    temperature=0.7,
+                    stop=REPLY_STOP_STRINGS,
+                    stream=True,
+                ):
+                    if stop_event is not None and stop_event.is_set():
+                        break
+                    yield chunk["choices"][0]["text"]
+            return
+
+        streamer = TextIteratorStreamer(
+            self.tokenizer, skip_prompt=True, skip_special_tokens=True
         )
-        response = self.tokenizer.decode(outputs[0], skip_special_tokens=True)
-        return response
+        stopping_criteria = None
+        if stop_event is not None:
+            stopping_criteria = StoppingCriteriaList([_EventStop(stop_event)])
+        inputs = self._encode(prompt, max_new_tokens)
+        errors = []
+
+        def run_generate():
+            try:
+                self._generate(
+                    inputs,
+                    max_new_tokens,
+                    streamer=streamer,
+                    stopping_criteria=stopping_criteria,
+                )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                errors.append(e)
+                streamer.end()  # Unblock the consumer; the error is re-raised below
+
+        with self._generate_lock:
+            worker = threading.Thread(target=run_generate, daemon=True)
+            worker.start()
+            yield from streamer
+            worker.join()
+        if errors:
+            raise errors[0]
+
+    def _encode(self, prompt, max_new_tokens):
+        """
+        Tokenize a prompt, capped so that prompt plus reply fit the context.
+
+        The history is bounded by message count, but replies vary a lot in
+        length; capping by tokens keeps the attention and key/value cache
+        within the model's context window however long the history gets.
+        """
+        return self.tokenizer(
+            prompt,
+            return_tensors="pt",
+            truncation=True,
+            max_length=max(1, self.context_length - max_new_tokens),
+        ).to(self.device)
+
+    def _encode_for_llama(self, prompt, max_new_tokens):
+        """
+        Tokenize a prompt for llama.cpp, capped like _encode().
+
+        llama.cpp raises instead of truncating when prompt plus reply exceed
+        its context, so the oldest tokens are dropped here, keeping BOS.
+        """
+        tokens = self.llm.tokenize(prompt.encode("utf-8"))
+        budget = max(1, self.llm.n_ctx() - max_new_tokens)
+        if len(tokens) <= budget:
+            return tokens
+        head = tokens[:1] if tokens[0] == self.llm.token_bos() else []
+        return head + tokens[len(tokens) - budget + len(head) :]
+
+    @torch.inference_mode()
+    def _generate(self, inputs, max_new_tokens, **generate_kwargs):
+        """
+        Run model.generate, reusing and then updating the key/value cache.
+
+        Must be called with _generate_lock held. Runs under inference mode,
+        which skips autograd bookkeeping; grad mode is per thread, so this
+        also covers the streaming worker thread.
+
+        Returns:
+            torch.Tensor: The generated sequences, prompt included
+        """
+        if self.draft_model is not None:
+            generate_kwargs["assistant_model"] = self.draft_model
+        # Only the tokens after the cached prefix need to be prefilled
+        try:
+            outputs = self.model.generate(
+                **inputs,
+                generation_config=self.generation_config,
+                tokenizer=self.tokenizer,  # Needed to match stop_strings
+                max_new_tokens=max_new_tokens,
+                past_key_values=self._reusable_cache(inputs["input_ids"]),
+                **generate_kwargs,
+            )
+        except Exception:
+            # generate() extends the cache in place, so after a failure it no
+            # longer matches _cached_ids
+            self._past_key_values = None
+            self._cached_ids = None
+            raise
+        sequences = outputs.sequences
+        # The cache covers every token except the last one generated
+        self._past_key_values = outputs.past_key_values
+        self._cached_ids = sequences[:, :-1]
+        return sequences
+
+
+class _EventStop(StoppingCriteria):
+    """Stopping criterion that ends generation once an event is set."""
+
+    def __init__(self, event):
+        self.event = event
+
+    def __call__(self, input_ids, scores, **kwargs):
+        return self.event.is_set()
 
 
-# Global PanAI instance for use throughout the application
-pan_ai = PanAI()
+def __getattr__(name):
+    """Create the global ``pan_ai`` instance lazily on first access."""
+    if name == "pan_ai":
+        return PanAI.get_instance()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -58,6 +58,18 @@ USE_DYNAMIC_ENERGY_THRESHOLD = os.getenv(
 SPEECH_RECOGNITION_TIMEOUT = int(os.getenv("SPEECH_RECOGNITION_TIMEOUT", "5"))
 PHRASE_TIME_LIMIT = int(os.getenv("PHRASE_TIME_LIMIT", "30" if is_macos else "10"))
 
+# AI model settings
+# Path to a quantized GGUF model; when set, PAN runs it with llama.cpp
+LLM_GGUF_PATH = os.getenv("LLM_GGUF_PATH")
+# Weight quantization: 4bit, 8bit or none (bitsandbytes on CUDA, 8bit on CPU)
+MODEL_QUANTIZATION_LEVEL = os.getenv("MODEL_QUANTIZATION_LEVEL", "4bit")
+# Maximum prompt plus reply length in tokens (capped at the model's own limit)
+MODEL_CONTEXT_LENGTH = int(os.getenv("MODEL_CONTEXT_LENGTH", "2048"))
+# Small model sharing the main model's tokenizer, used for speculative decoding
+DRAFT_MODEL_NAME = os.getenv("DRAFT_MODEL_NAME")
+# Compile the model forward pass with torch.compile (slow first call)
+COMPILE_MODEL = os.getenv("COMPILE_MODEL", "False").lower() in ("true", "1", "t")
+
 # Conversation settings
 MAX_SHORT_TERM_MEMORY = int(os.getenv("MAX_SHORT_TERM_MEMORY", "10"))
 IDLE_THRESHOLD_SECONDS = int(os.getenv("IDLE_THRESHOLD_SECONDS", "300"))
@@ -90,6 +102,13 @@ def get_config():
             "rate": DEFAULT_VOICE_RATE,
             "volume": DEFAULT_VOICE_VOLUME,
         },
+        "model": {
+            "gguf_path": LLM_GGUF_PATH or "Not Set",
+            "quantization": MODEL_QUANTIZATION_LEVEL,
+            "draft_model": DRAFT_MODEL_NAME or "Not Set",
+            "context_length": MODEL_CONTEXT_LENGTH,
+            "compile": COMPILE_MODEL,
+        },
         "conversation": {
             "max_short_term_memory": MAX_SHORT_TERM_MEMORY,
             "idle_threshold_seconds": IDLE_THRESHOLD_SECONDS,
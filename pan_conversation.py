@@ -1,9 +1,19 @@
+import re
 import threading
 
-from pan_ai import pan_ai  # Ensure pan_ai is properly imported
+from pan_ai import PanAI  # Model is loaded on first use, see PanAI.get_instance
 from pan_research import fetch_news, fetch_weather
 from pan_speech import speak, stop_speaking
 
+# Utterances that interrupt response generation and speech
+STOP_COMMANDS = frozenset(("stop", "cancel", "halt"))
+
+# Splits an utterance into lowercase words for command lookup
+WORD_RE = re.compile(r"[a-z']+")
+
+# Whitespace after a sentence end; streamed replies are spoken sentence by sentence
+SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 # Conversation state management class
 class ConversationState:
@@ -33,36 +43,36 @@ class ConversationState:
     def clear_history(cls):
         """Clear the conversation history"""
         cls.conversation_history = []
+        # The model's cached context was built from the old history
+        PanAI.reset_loaded_context()
 
 
 def respond(user_input, user_id=None):  # pylint: disable=unused-argument
     """
-    Generate a response to user input.
+    Generate and speak a response to user input.
 
     Args:
         user_input (str): The user's input text
         user_id (str, optional): User identifier for personalization (not used currently)
 
     Returns:
-        str: The assistant's response
+        str: The assistant's response, or "" if it is still being streamed
     """
     if not user_input or user_input.strip() == "":
-        return "Sorry, I didn't catch that."
+        return reply("Sorry, I didn't catch that.")
+
+    # Command: Stop Response Generation or Speaking
+    if is_stop_command(user_input):
+        interrupt()
+        return reply("Okay, I've stopped.")
 
     user_input_lower = user_input.lower()
 
-    # Command: Stop Response Generation or Speaking
-    if user_input_lower in ["stop", "cancel", "halt"]:
-        ConversationState.stop_generation_event.set()  # Trigger the stop event
-        stop_speaking()  # Immediately stop speaking
-        print("[PAN] Response generation and speech stopped.")
-        return "Okay, I've stopped."
-
-    # Detect Commands (Weather, News)
-    if "weather" in user_input_lower:
-        return handle_weather()
-    if "news" in user_input_lower:
-        return handle_news()
+    # Detect Commands (Weather, News) with one dictionary lookup per word
+    for word in WORD_RE.findall(user_input_lower):
+        handler = COMMAND_HANDLERS.get(word)
+        if handler:
+            return reply(handler())
 
     # Clear the stop event to allow fresh response generation
     ConversationState.stop_generation_event.clear()
@@ -70,13 +80,34 @@ def respond(user_input, user_id=None):  # pylint: disable=unused-argument
     return gpt_neo_conversation(user_input)
 
 
+def is_stop_command(text):
+    """Return True if the utterance asks PAN to stop talking."""
+    return text.strip().lower() in STOP_COMMANDS
+
+
+def interrupt():
+    """
+    Stop response generation and speech immediately.
+
+    Safe to call from the listening thread while a reply is still being
+    generated or spoken; calling it again is harmless.
+    """
+    ConversationState.stop_generation_event.set()  # Trigger the stop event
+    stop_speaking()  # Immediately stop speaking
+    print("[PAN] Response generation and speech stopped.")
+
+
+def reply(text):
+    """Speak a response and return it."""
+    speak(text)
+    return text
+
+
 def handle_weather():
-    """Fetch and speak the weather."""
+    """Fetch the weather."""
     try:
         weather_info = fetch_weather()
-        response = f"The current weather is: {weather_info}"
-        speak(response)
-        return response
+        return f"The current weather is: {weather_info}"
     except ValueError as e:
         print(f"[PAN ERROR] Weather API error: {e}")
         return "Sorry, there was an issue with the weather data format."
@@ -89,12 +120,10 @@ def handle_weather():
 
 
 def handle_news():
-    """Fetch and speak the news."""
+    """Fetch the news."""
     try:
         news_info = fetch_news()
-        response = f"Here are the latest news headlines: {news_info}"
-        speak(response)
-        return response
+        return f"Here are the latest news headlines: {news_info}"
     except ValueError as e:
         print(f"[PAN ERROR] News API error: {e}")
         return "Sorry, there was an issue with the news data format."
@@ -106,6 +135,13 @@ def handle_news():
         return "Sorry, I encountered an unexpected issue while getting the latest news."
 
 
+# Command keyword -> handler, looked up by respond()
+COMMAND_HANDLERS = {
+    "weather": handle_weather,
+    "news": handle_news,
+}
+
+
 def gpt_neo_conversation(prompt):
     """Generate a conversational response using the AI model"""
 
@@ -114,8 +150,9 @@ def gpt_neo_conversation(prompt):
     print("Generating response... (Say 'stop' to interrupt)")
 
     # Start response generation in a separate thread
+    result = {}
     response_thread = threading.Thread(
-        target=generate_response_thread, args=(context_text, prompt)
+        target=generate_response_thread, args=(context_text, prompt, result)
     )
     response_thread.start()
     response_thread.join(
@@ -123,55 +160,78 @@ def gpt_neo_conversation(prompt):
     )  # Allow response to generate, but make it interruptible
 
     if ConversationState.stop_generation_event.is_set():
+        # The stop command that interrupted it is acknowledged by respond()
         print("[PAN] Response generation was interrupted.")
-        return "Okay, I've stopped."
+        return ""
 
-    # Retrieve the last response if not interrupted
-    history = ConversationState.get_history()
-    if history and history[-1].startswith("PAN: "):
-        return history[-1].replace("PAN: ", "")
+    if "error" in result:
+        return reply(result["error"])
 
-    return "Sorry, I couldn't generate a response."
+    # The reply has already been spoken sentence by sentence while streaming.
+    # If it is still streaming, the thread keeps speaking it on its own.
+    return result.get("response", "")
 
 
-def generate_response_thread(context_text, _):
+def generate_response_thread(context_text, _, result):
     """
     Thread function for generating a response.
 
+    Speaks each sentence as soon as it has been generated, so speech starts
+    while the rest of the reply is still being generated.
+
     Args:
         context_text (str): The conversation context
         _ (str): Unused parameter (previously prompt)
+        result (dict): Receives the "response", or an "error" message to speak
     """
+    stop_event = ConversationState.stop_generation_event
     try:
         # Generate response using PAN's context only (no user text)
-        response = pan_ai.generate_response(context_text + "\nPAN:", max_new_tokens=150)
+        pieces = []
+        pending = ""
+        for piece in PanAI.get_instance().stream_response(
+            context_text + "\nPAN:", max_new_tokens=150, stop_event=stop_event
+        ):
+            pieces.append(piece)
+            *sentences, pending = SENTENCE_END_RE.split(pending + piece)
+            for sentence in sentences:
+                # Keep draining the stream, which ends at the next token once
+                # the event is set, but don't queue any more speech
+                if stop_event.is_set():
+                    break
+                speak(sentence.strip())
 
         # If the stop event is triggered, abandon response
-        if ConversationState.stop_generation_event.is_set():
+        if stop_event.is_set():
             print("[PAN] Response generation interrupted.")
             return
 
-        # Store only PAN's response in memory
-        ConversationState.add_to_history(f"PAN: {response}")
+        if pending.strip():
+            speak(pending.strip())
+        response = "".join(pieces).strip()
+        if not response:
+            # E.g. the first generated token was a newline, which ends the reply
+            print("[PAN ERROR] The model generated an empty response.")
+            result["error"] = "Sorry, I couldn't think of a response."
+        else:
+            # Store only PAN's response in memory
+            ConversationState.add_to_history(f"PAN: {response}")
+            result["response"] = response
 
         # Memory length is maintained by ConversationState.add_to_history
-
-        speak(response)  # Immediately speak the response (interruptible)
     except ValueError as e:
         print(f"[PAN ERROR] Invalid input for response generation: {e}")
-        ConversationState.add_to_history(
-            "PAN: Sorry, I couldn't understand how to respond."
-        )
+        result["error"] = "Sorry, I couldn't understand how to respond."
     except RuntimeError as e:
         print(f"[PAN ERROR] Runtime error during response generation: {e}")
-        ConversationState.add_to_history(
-            "PAN: Sorry, I encountered an issue while thinking."
-        )
+        result["error"] = "Sorry, I encountered an issue while thinking."
     except Exception as e:  # pylint: disable=broad-exception-caught
         print(f"[PAN ERROR] Unexpected error during response generation: {e}")
-        ConversationState.add_to_history(
-            "PAN: Sorry, I couldn't generate a response due to an unexpected issue."
+        result["error"] = (
+            "Sorry, I couldn't generate a response due to an unexpected issue."
         )
+    if "error" in result:
+        ConversationState.add_to_history(f"PAN: {result['error']}")
 
 
 def summarize_memory():
@@ -6,6 +6,8 @@ manage opinions, track user affinity, and access web APIs for real-time data lik
 weather and news. It serves as PAN's connection to external data sources.
 """
 
+import time
+
 import requests  # type: ignore
 
 try:
@@ -55,6 +57,38 @@ if not pan_settings.pan_settings.NEWS_API_KEY:
     print("Warning: News API key is missing. News functionality will be limited.")
 
 
+# Cache of recent API responses, keyed by request: {key: (timestamp, response)}
+RESPONSE_CACHE_TTL_SECONDS = 600
+response_cache: dict[tuple, tuple[float, str]] = {}
+
+
+def get_cached_response(key):
+    """
+    Return a cached response if it is younger than RESPONSE_CACHE_TTL_SECONDS.
+
+    Args:
+        key (tuple): Normalized request key, e.g. ("weather", city, country_code)
+
+    Returns:
+        str or None: The cached response, or None on a miss
+    """
+    entry = response_cache.get(key)
+    if entry and time.monotonic() - entry[0] < RESPONSE_CACHE_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def cache_response(key, response):
+    """
+    Store a successful response so repeated requests skip the network.
+
+    Args:
+        key (tuple): Normalized request key
+        response (str): The response to cache
+    """
+    response_cache[key] = (time.monotonic(), response)
+
+
 # Free Web Search using DuckDuckGo with Google Fallback
 def live_search(query):
     response = duckduckgo_search(query)
@@ -102,6 +136,11 @@ def fetch_weather(city="Kelso", country_code="US"):
     if not api_key:
         return "Weather API key is missing in settings."
 
+    cache_key = ("weather", city.strip().lower(), country_code.strip().upper())
+    cached = get_cached_response(cache_key)
+    if cached:
+        return cached
+
     url = f"http://api.openweathermap.org/data/2.5/weather?q={city},{country_code}&appid={api_key}&units=metric"
     try:
         response = requests.get(url, timeout=10)
@@ -109,7 +148,11 @@ def fetch_weather(city="Kelso", country_code="US"):
         if "main" in data:
             temp = data["main"]["temp"]
             description = data["weather"][0]["description"]
-            return f"The current temperature in {city} is {temp}°C with {description}."
+            weather = (
+                f"The current temperature in {city} is {temp}°C with {description}."
+            )
+            cache_response(cache_key, weather)
+            return weather
         return "Sorry, I couldn't fetch the weather data. Check the city name or try again."
     except requests.RequestException:
         return "Error: Could not connect to the weather service."
@@ -121,6 +164,10 @@ def fetch_news():
     if not api_key:
         return "News API key is missing in settings."
 
+    cached = get_cached_response(("news",))
+    if cached:
+        return cached
+
     url = f"https://newsapi.org/v2/top-headlines?country=us&apiKey={api_key}"
     try:
         response = requests.get(url, timeout=10)
@@ -128,7 +175,9 @@ def fetch_news():
         articles = data.get("articles", [])
         if articles:
             headlines = [article["title"] for article in articles[:5]]
-            return "Here are the latest news headlines: " + ", ".join(headlines)
+            news = "Here are the latest news headlines: " + ", ".join(headlines)
+            cache_response(("news",), news)
+            return news
         return "No news available right now."
     except requests.RequestException:
         return "Error: Could not connect to the news service."
@@ -1,9 +1,7 @@
 import os
 
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
+# pan_config loads the .env file once on import; no need to parse it again here
+from pan_config import DEFAULT_CITY, DEFAULT_COUNTRY_CODE
 
 
 class PanSettings:
@@ -21,8 +19,8 @@ class PanSettings:
         self.NEWS_API_KEY = os.getenv("NEWS_API_KEY")
 
         # Default Location Settings
-        self.DEFAULT_CITY = "Kelso"
-        self.DEFAULT_COUNTRY_CODE = "US"
+        self.DEFAULT_CITY = DEFAULT_CITY
+        self.DEFAULT_COUNTRY_CODE = DEFAULT_COUNTRY_CODE
 
         # Conversation Mode (Advanced GPT-J)
         self.USE_GPT2_FOR_CONVERSATION = True  # Set to False to disable GPT-J
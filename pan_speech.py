@@ -14,7 +14,7 @@ import traceback
 
 import speech_recognition as sr
 
-from pan_config import DEFAULT_VOICE_VOLUME
+from pan_config import ASSISTANT_NAME, DEFAULT_VOICE_VOLUME
 from pan_emotions import pan_emotions
 
 # Import Windows-specific modules conditionally
@@ -31,9 +31,14 @@ try:
 except ImportError:
     pass  # VOSK not installed - local recognition will not be available
 
-# Detect OS
-is_windows = platform.system().lower() == "windows"
-is_linux = platform.system().lower() == "linux"
+# Detect OS once at import
+PLATFORM = platform.system()
+is_windows = PLATFORM.lower() == "windows"
+is_linux = PLATFORM.lower() == "linux"
+is_macos = PLATFORM == "Darwin"
+
+# Wake word (the assistant's name), lowercased once for keyword matching
+WAKE_WORD = ASSISTANT_NAME.lower()
 
 # Path to the VOSK model (adjust to your directory)
 VOSK_MODEL_PATH = "vosk_model"
@@ -51,6 +56,12 @@ class SpeakManager:
     def __init__(self):
         self.queue = queue.Queue()
         self.lock = threading.Lock()
+        # Texts queued or being spoken; guarded by idle_condition so "queue
+        # drained" and "new text queued" can never interleave
+        self.pending = 0
+        self.idle_condition = threading.Condition()
+        self.idle_since = 0.0  # time.monotonic() when pending last dropped to 0
+        self.utterance_count = 0  # Number of texts ever queued via speak()
         self.thread = threading.Thread(target=self._worker, daemon=True)
         self.thread.start()
         self._init_engine()
@@ -78,7 +89,7 @@ class SpeakManager:
             print("[SpeakManager] Using pyttsx3 fallback")
 
             # On macOS, select the best available voice
-            if platform.system() == "Darwin":
+            if is_macos:
                 # Try to get voices
                 voices = self.engine.getProperty("voices")
                 if voices and len(voices) > 1:
@@ -111,10 +122,15 @@ class SpeakManager:
 
     def speak(self, text, mood_override=None):
         """Queue text for speaking."""
-        self.queue.put((text, mood_override or pan_emotions.get_mood()))
+        mood = mood_override or pan_emotions.get_mood()
+        with self.idle_condition:
+            self.pending += 1
+            self.utterance_count += 1
+            self.queue.put((text, mood))
 
     def stop(self):
-        """Immediately stop any ongoing speech."""
+        """Immediately stop any ongoing speech and drop queued utterances."""
+        self._discard_pending()
         self.interrupt_speaking.set()  # Trigger interrupt event
         with self.lock:
             if is_windows and win32com is not None:
@@ -124,6 +140,24 @@ class SpeakManager:
                 self.engine.stop()  # Stop current speech
         print("[SpeakManager] Speech interrupted.")
 
+    def _discard_pending(self):
+        """Drop queued utterances, e.g. the remaining sentences of a streamed reply."""
+        with self.idle_condition:
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                self.queue.task_done()
+                self._finish_one()
+
+    def _finish_one(self):
+        """Mark one queued text as done. Must hold idle_condition."""
+        self.pending -= 1
+        if self.pending == 0:
+            self.idle_since = time.monotonic()
+            self.idle_condition.notify_all()
+
     def _worker(self):
         """TTS Worker Thread - Continuous Processing"""
         while True:
@@ -150,6 +184,8 @@ class SpeakManager:
                 self._init_engine()  # Re-initialize on failure
             finally:
                 self.queue.task_done()
+                with self.idle_condition:
+                    self._finish_one()
 
     def _process_long_sentence(self, sentence, max_chunk_size):
         """Process a long sentence by splitting on commas"""
@@ -184,6 +220,7 @@ class SpeakManager:
                 # If sentence is longer than max_chunk_size, split by commas
                 if len(sentence) > max_chunk_size:
                     chunks.extend(self._process_long_sentence(sentence, max_chunk_size))
+                    current_chunk = ""
                 else:
                     current_chunk = sentence
 
@@ -221,6 +258,12 @@ class SpeakManager:
             if sentence.strip():
                 sentences.append(sentence.strip() + ".")
 
+        # Speak the first sentence on its own so audio starts as soon as it is
+        # synthesized, instead of after the whole first chunk
+        if len(sentences) > 1 and len(sentences[0]) <= max_chunk_size:
+            return [sentences[0]] + self._process_sentences_into_chunks(
+                sentences[1:], max_chunk_size
+            )
         return self._process_sentences_into_chunks(sentences, max_chunk_size)
 
     def _speak_chunk(self, chunk, _):  # Using _ for unused mood parameter
@@ -233,7 +276,7 @@ class SpeakManager:
             self.engine.runAndWait()
 
         # After speaking, calculate sleep time based on platform
-        if platform.system() == "Darwin":
+        if is_macos:
             # macOS needs less time between chunks
             time.sleep(0.1)
         else:
@@ -248,20 +291,34 @@ class SpeakManager:
             # Set speaking event
             self.speaking_event.set()
 
-            # Chunk text for better control and smoother speech
-            chunks = self._chunk_text(text)
+            try:
+                # Chunk text for better control and smoother speech
+                chunks = self._chunk_text(text)
 
-            for chunk in chunks:
-                # Check if speech should be interrupted
-                if self.interrupt_speaking.is_set():
-                    print("[SpeakManager] Speech interrupted mid-chunking.")
-                    break
+                for chunk in chunks:
+                    # Check if speech should be interrupted
+                    if self.interrupt_speaking.is_set():
+                        print("[SpeakManager] Speech interrupted mid-chunking.")
+                        break
 
-                self._speak_chunk(chunk, mood)
-                self.speech_count += 1
+                    self._speak_chunk(chunk, mood)
+                    self.speech_count += 1
+            finally:
+                # Clear speaking event when done, even if the engine failed
+                self.speaking_event.clear()
+
+    def wait_until_idle(self, timeout=None):
+        """
+        Block until all queued speech has finished.
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds
 
-            # Clear speaking event when done
-            self.speaking_event.clear()
+        Returns:
+            bool: True if speech finished, False if the timeout expired first
+        """
+        with self.idle_condition:
+            return self.idle_condition.wait_for(lambda: self.pending == 0, timeout)
 
 
 # Global instance of SpeakManager
@@ -290,9 +347,10 @@ def test_microphone():
     """
     print("Testing microphone...")
 
-    # First, check if microphones are available
+    # First, check if microphones are available; re-enumerate since this is
+    # a diagnostic, which also refreshes the cache for everyone else
     try:
-        microphone_names = sr.Microphone.list_microphone_names()
+        microphone_names = list_microphones(refresh=True)
         if not microphone_names:
             print("[ERROR] No microphones detected.")
             return False
@@ -369,6 +427,28 @@ def recalibrate_microphone(calibrate_duration=5.0):
         return False
 
 
+# Cached result of the (slow) microphone enumeration, see list_microphones()
+_microphone_cache: dict[str, list[str]] = {}
+
+
+def list_microphones(refresh=False):
+    """
+    Return the names of the available microphones.
+
+    Enumerating audio devices is slow (it probes CoreAudio on macOS), so the
+    result is cached after the first call and shared by every caller.
+
+    Args:
+        refresh (bool): Re-enumerate the devices instead of using the cache
+
+    Returns:
+        list: Microphone device names
+    """
+    if refresh or "names" not in _microphone_cache:
+        _microphone_cache["names"] = sr.Microphone.list_microphone_names()
+    return _microphone_cache["names"]
+
+
 def _check_macos_microphone_permissions():
     """Check microphone permissions specifically on macOS systems"""
     # Only check on macOS systems
@@ -377,7 +457,7 @@ def _check_macos_microphone_permissions():
     # Check if we've already verified permissions in this session
     if not hasattr(sr.Microphone, "_checked_macos_permissions"):
         try:
-            microphone_names = sr.Microphone.list_microphone_names()
+            microphone_names = list_microphones()
             if not microphone_names:
                 print("[ERROR] No microphones detected. MACOS PERMISSION ERROR.")
                 print("Please grant microphone permissions in System Preferences.")
@@ -393,7 +473,7 @@ def _check_macos_microphone_permissions():
     return True
 
 
-def _listen_and_detect_keyword():
+def _listen_and_detect_keyword(timeout=3, phrase_time_limit=5):
     """Core implementation of keyword detection logic"""
     result = False
     # Initialize recognizer
@@ -404,15 +484,14 @@ def _listen_and_detect_keyword():
         recognizer.adjust_for_ambient_noise(source, duration=1.0)
         try:
             # Listen for audio
-            audio = recognizer.listen(source, timeout=3, phrase_time_limit=5)
+            audio = recognizer.listen(
+                source, timeout=timeout, phrase_time_limit=phrase_time_limit
+            )
             # Convert to text
             text = recognizer.recognize_google(audio).lower()
             print(f"Heard: {text}")
             # Check if keyword/wake word is in the text
-            from pan_config import ASSISTANT_NAME
-
-            keyword = ASSISTANT_NAME.lower()
-            result = keyword in text
+            result = WAKE_WORD in text
         except sr.WaitTimeoutError:
             print("Keyword listening timed out.")
         except sr.UnknownValueError:
@@ -424,12 +503,18 @@ def _listen_and_detect_keyword():
     return result
 
 
-def listen_for_keyword():
+def listen_for_keyword(timeout=3, phrase_time_limit=5):
     """
     Listen specifically for the wake word/keyword.
 
     This function listens for a keyword (typically the assistant name)
     and checks if microphone permissions are properly set up on macOS.
+    It blocks on the microphone stream for up to ``timeout`` seconds, so
+    callers can loop on it directly without sleeping between attempts.
+
+    Args:
+        timeout (float): Maximum time to wait for speech to start (seconds)
+        phrase_time_limit (float): Maximum phrase duration (seconds)
 
     Returns:
         bool: True if keyword was detected, False otherwise
@@ -438,7 +523,7 @@ def listen_for_keyword():
     if not _check_macos_microphone_permissions():
         return False
     # Then perform the actual listening and keyword detection
-    return _listen_and_detect_keyword()
+    return _listen_and_detect_keyword(timeout, phrase_time_limit)
 
 
 def listen_to_user(timeout=5, phrase_time_limit=10, recalibrate=False):
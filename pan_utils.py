@@ -4,16 +4,8 @@ Utility functions for PAN (Personal Assistant with Nuance)
 This module provides shared utility functions and common code used across different modules.
 """
 
-# pylint: disable=duplicate-code
-# The duplication with init_db.py and pan_core.py is intentional
-# as we need the same database schema in multiple components
-
-import sqlite3
-
 import torch
 
-from pan_config import DATABASE_PATH
-
 
 def create_quantization_config(quant_level):
     """
@@ -65,68 +57,3 @@ def create_quantization_config(quant_level):
         )
         bits = None
     return quantization_config, bits
-
-
-def initialize_database(verbose=True):
-    """
-    Initialize the SQLite database used by PAN for persistent storage.
-
-    Creates the database and necessary tables if they don't already exist.
-    Tables include:
-    - users: Store user information
-    - memories: Store PAN's memories and knowledge
-    - opinions: Store PAN's opinions on various topics
-    - affinity: Store relationship scores with different users
-    - news_archive: Cache news information to avoid redundant notifications
-
-    Args:
-        verbose (bool): Whether to print status messages during initialization
-
-    Returns:
-        None
-    """
-    if verbose:
-        print(f"Initializing database at {DATABASE_PATH}...")
-
-    with sqlite3.connect(DATABASE_PATH) as conn:
-        cursor = conn.cursor()
-
-        # Create tables if they don't exist
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS users (
-            user_id TEXT PRIMARY KEY,
-            name TEXT NOT NULL
-        )"""
-        )
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS memories (
-            id INTEGER PRIMARY KEY,
-            category TEXT,
-            content TEXT
-        )"""
-        )
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS opinions (
-            id INTEGER PRIMARY KEY,
-            topic TEXT,
-            opinion TEXT,
-            strength INTEGER
-        )"""
-        )
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS affinity (
-            user_id TEXT PRIMARY KEY,
-            score INTEGER
-        )"""
-        )
-        cursor.execute(
-            """CREATE TABLE IF NOT EXISTS news_archive (
-            id INTEGER PRIMARY KEY,
-            headline TEXT,
-            date TEXT
-        )"""
-        )
-        conn.commit()
-
-    if verbose:
-        print("Database initialization complete!")
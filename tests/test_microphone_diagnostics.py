@@ -175,6 +175,10 @@ class TestMicrophoneTest(unittest.TestCase):
 class TestMacOSPermissionsCheck(unittest.TestCase):
     """Test macOS permissions check function."""
 
+    def setUp(self):
+        # Each test enumerates its own mocked microphones
+        pan_speech._microphone_cache.clear()
+
     @unittest.skipIf(not IS_MACOS, "Test only relevant on macOS")
     @mock.patch("platform.system")
     def test_non_macos_skips_check(self, mock_system):
@@ -299,6 +303,10 @@ class TestMacOSPermissionsCheck(unittest.TestCase):
 class TestListenForKeyword(unittest.TestCase):
     """Test keyword detection function with additional diagnostic improvements."""
 
+    def setUp(self):
+        # Each test enumerates its own mocked microphones
+        pan_speech._microphone_cache.clear()
+
     @unittest.skipIf(not IS_MACOS, "Test only relevant on macOS")
     @mock.patch("pan_speech.sr.Microphone")
     @mock.patch("pan_speech.sr.Recognizer")
@@ -0,0 +1,46 @@
+"""Tests for the llama.cpp backend of the pan_ai module."""
+
+import unittest
+from unittest import mock
+
+import pan_ai
+
+
+@mock.patch("pan_ai.LLM_GGUF_PATH", "model.gguf")
+@mock.patch("pan_ai.Llama")
+class TestLlamaBackend(unittest.TestCase):
+    """Test that llama.cpp replies end at the end of PAN's line."""
+
+    def _make_ai(self, mock_llama):
+        llm = mock_llama.return_value
+        llm.tokenize.return_value = [1, 2, 3]
+        llm.n_ctx.return_value = 2048
+        llm.token_bos.return_value = 1
+        return pan_ai.PanAI(), llm
+
+    def test_generate_response_stops_at_newline(self, mock_llama):
+        """Test that generate_response passes the reply stop strings."""
+        ai, llm = self._make_ai(mock_llama)
+        llm.return_value = {"choices": [{"text": " Hello there."}]}
+
+        response = ai.generate_response("PAN:", max_new_tokens=50)
+
+        self.assertEqual(response, "Hello there.")
+        self.assertEqual(llm.call_args.kwargs["stop"], ["\n"])
+
+    def test_stream_response_stops_at_newline(self, mock_llama):
+        """Test that stream_response passes the reply stop strings."""
+        ai, llm = self._make_ai(mock_llama)
+        llm.return_value = iter(
+            [{"choices": [{"text": " Hello"}]}, {"choices": [{"text": " there."}]}]
+        )
+
+        pieces = list(ai.stream_response("PAN:", max_new_tokens=50))
+
+        self.assertEqual(pieces, [" Hello", " there."])
+        self.assertEqual(llm.call_args.kwargs["stop"], ["\n"])
+        self.assertTrue(llm.call_args.kwargs["stream"])
+
+
+if __name__ == "__main__":
+    unittest.main()
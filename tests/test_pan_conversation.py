@@ -0,0 +1,51 @@
+"""Tests for command dispatch in the pan_conversation module."""
+
+import unittest
+from unittest import mock
+
+import pan_conversation
+
+
+@mock.patch.object(pan_conversation, "speak")
+@mock.patch.object(pan_conversation, "gpt_neo_conversation", return_value="Model reply")
+class TestCommandDispatch(unittest.TestCase):
+    """Test that command keywords only match whole words."""
+
+    def setUp(self):
+        self.weather = mock.MagicMock(return_value="Sunny")
+        self.news = mock.MagicMock(return_value="Headlines")
+        patcher = mock.patch.dict(
+            pan_conversation.COMMAND_HANDLERS,
+            {"weather": self.weather, "news": self.news},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_command_word_dispatches(self, mock_conversation, mock_speak):
+        """Test that a command keyword runs its handler instead of the model."""
+        response = pan_conversation.respond("What's the Weather like today?")
+
+        self.assertEqual(response, "Sunny")
+        self.weather.assert_called_once()
+        mock_speak.assert_called_once_with("Sunny")
+        mock_conversation.assert_not_called()
+
+    def test_keyword_inside_word_does_not_dispatch(self, mock_conversation, _):
+        """Test that "newspaper" doesn't trigger the news command."""
+        response = pan_conversation.respond("Read me the newspaper")
+
+        self.assertEqual(response, "Model reply")
+        self.news.assert_not_called()
+        mock_conversation.assert_called_once_with("Read me the newspaper")
+
+    def test_keyword_with_suffix_does_not_dispatch(self, mock_conversation, _):
+        """Test that "weather's" is a different word from "weather"."""
+        response = pan_conversation.respond("The weather's been strange lately")
+
+        self.assertEqual(response, "Model reply")
+        self.weather.assert_not_called()
+        mock_conversation.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
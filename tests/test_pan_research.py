@@ -0,0 +1,75 @@
+"""Tests for the API response cache in the pan_research module."""
+
+import unittest
+from unittest import mock
+
+import pan_research
+
+SETTINGS = pan_research.pan_settings.pan_settings
+
+
+def _weather_reply(temp=21.5):
+    """Build a fake OpenWeatherMap HTTP response."""
+    response = mock.MagicMock()
+    response.json.return_value = {
+        "main": {"temp": temp},
+        "weather": [{"description": "clear sky"}],
+    }
+    return response
+
+
+@mock.patch.object(SETTINGS, "OPENWEATHERMAP_API_KEY", "key")
+@mock.patch.object(SETTINGS, "NEWS_API_KEY", "key")
+@mock.patch("pan_research.time.monotonic")
+@mock.patch("pan_research.requests.get")
+class TestResponseCache(unittest.TestCase):
+    """Test that weather and news responses are cached for a limited time."""
+
+    def setUp(self):
+        pan_research.response_cache.clear()
+
+    def test_repeated_request_hits_cache(self, mock_get, mock_monotonic):
+        """Test that a second request within the TTL skips the network."""
+        mock_get.return_value = _weather_reply()
+        mock_monotonic.return_value = 1000.0
+
+        first = pan_research.fetch_weather("Kelso", "US")
+        mock_monotonic.return_value = 1010.0
+        second = pan_research.fetch_weather(" kelso ", "us")
+
+        self.assertEqual(first, second)
+        self.assertIn("21.5°C", first)
+        mock_get.assert_called_once()
+
+    def test_cached_response_expires(self, mock_get, mock_monotonic):
+        """Test that a request after the TTL fetches fresh data."""
+        mock_get.side_effect = [_weather_reply(21.5), _weather_reply(25.0)]
+        mock_monotonic.return_value = 1000.0
+
+        pan_research.fetch_weather("Kelso", "US")
+        ttl = pan_research.RESPONSE_CACHE_TTL_SECONDS
+        mock_monotonic.return_value = 1000.0 + ttl + 1
+        fresh = pan_research.fetch_weather("Kelso", "US")
+
+        self.assertIn("25.0°C", fresh)
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_failures_are_not_cached(self, mock_get, mock_monotonic):
+        """Test that errors and empty results are retried on the next request."""
+        mock_monotonic.return_value = 1000.0
+        empty_news = mock.MagicMock()
+        empty_news.json.return_value = {"articles": []}
+        mock_get.side_effect = [
+            pan_research.requests.RequestException("offline"),
+            empty_news,
+        ]
+
+        self.assertIn("Could not connect", pan_research.fetch_news())
+        self.assertEqual(pan_research.fetch_news(), "No news available right now.")
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(pan_research.response_cache, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
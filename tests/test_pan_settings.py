@@ -0,0 +1,41 @@
+"""Tests for the pan_settings module."""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+
+def _fresh_settings():
+    """Import pan_settings (and pan_config) again under the current environment."""
+    sys.modules.pop("pan_config", None)
+    sys.modules.pop("pan_settings", None)
+    import pan_settings
+
+    return pan_settings.PanSettings()
+
+
+# Restore the original modules afterwards so other tests keep their references
+@mock.patch.dict(sys.modules)
+class TestPanSettingsLocation(unittest.TestCase):
+    """Test that the default location comes from pan_config."""
+
+    @mock.patch.dict(os.environ, {"DEFAULT_CITY": "Oslo", "DEFAULT_COUNTRY_CODE": "NO"})
+    def test_location_from_environment(self):
+        """Test that DEFAULT_CITY and DEFAULT_COUNTRY_CODE are read from the env."""
+        settings = _fresh_settings()
+        self.assertEqual(settings.DEFAULT_CITY, "Oslo")
+        self.assertEqual(settings.DEFAULT_COUNTRY_CODE, "NO")
+
+    @mock.patch.dict(os.environ, {})
+    def test_location_defaults(self):
+        """Test that the location falls back to pan_config's defaults."""
+        os.environ.pop("DEFAULT_CITY", None)
+        os.environ.pop("DEFAULT_COUNTRY_CODE", None)
+        settings = _fresh_settings()
+        self.assertEqual(settings.DEFAULT_CITY, "Kelso")
+        self.assertEqual(settings.DEFAULT_COUNTRY_CODE, "US")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 """Tests for the Text-to-Speech functionality in pan_speech module."""
 
 import platform
+import threading
 import time
 import unittest
 from unittest import mock
@@ -144,6 +145,35 @@ class TestSpeakManager(unittest.TestCase):
                 else:
                     self.assertLessEqual(len(chunk), 150)
 
+    @mock.patch("platform.system")
+    def test_chunk_text_speaks_first_sentence_alone(self, mock_system):
+        """Test that long text starts with its first sentence as its own chunk."""
+        with mock.patch("pyttsx3.init"):
+            manager = SpeakManager()
+            mock_system.return_value = "Windows"
+
+            long_text = "This is sentence one. This is sentence two. " * 20
+            chunks = manager._chunk_text(long_text)
+
+            self.assertEqual(chunks[0], "This is sentence one.")
+            self.assertTrue(chunks[1].startswith("This is sentence two."))
+            # Nothing is lost or repeated by splitting off the first sentence
+            self.assertEqual(" ".join(chunks).count("sentence one."), 20)
+            self.assertEqual(" ".join(chunks).count("sentence two."), 20)
+
+    def test_process_sentences_does_not_repeat_chunk_after_long_sentence(self):
+        """Test that a comma-split sentence doesn't re-emit the previous chunk."""
+        with mock.patch("pyttsx3.init"):
+            manager = SpeakManager()
+
+            long_sentence = "A clause that goes on, " * 10 + "and ends."
+            sentences = ["Short one.", long_sentence, "Short two."]
+            chunks = manager._process_sentences_into_chunks(sentences, 100)
+
+            self.assertEqual(chunks[0], "Short one.")
+            self.assertEqual(chunks[-1], "Short two.")
+            self.assertEqual(" ".join(chunks).count("Short one."), 1)
+
     @mock.patch("platform.system")
     @mock.patch("time.sleep")
     def test_worker_platform_specific_sleep(self, mock_sleep, mock_system):
@@ -328,5 +358,61 @@ class TestSpeakManager(unittest.TestCase):
             manager._init_engine.assert_not_called()
 
 
+class TestSpeakManagerIdle(unittest.TestCase):
+    """Test how SpeakManager tracks queued speech across threads."""
+
+    def setUp(self):
+        with mock.patch("pyttsx3.init"):
+            self.manager = SpeakManager()
+        self.spoken = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+        def fake_speak(text, _mood):
+            self.spoken.append(text)
+            self.started.set()
+            self.release.wait(timeout=2)
+
+        self.manager._speak_with_recovery = fake_speak
+
+    def tearDown(self):
+        self.release.set()
+
+    def test_idle_after_queue_drains(self):
+        """Test that the manager is idle once every queued text was spoken."""
+        self.release.set()
+        self.manager.speak("One", mood_override="neutral")
+        self.manager.speak("Two", mood_override="neutral")
+
+        self.assertTrue(self.manager.wait_until_idle(timeout=2))
+        self.assertEqual(self.spoken, ["One", "Two"])
+        self.assertEqual(self.manager.pending, 0)
+
+    def test_not_idle_while_text_queued(self):
+        """Test that the manager isn't idle while text is speaking or queued."""
+        self.manager.speak("One", mood_override="neutral")
+        self.assertTrue(self.started.wait(timeout=2))
+        self.manager.speak("Two", mood_override="neutral")
+
+        self.assertFalse(self.manager.wait_until_idle(timeout=0.1))
+
+        self.release.set()
+        self.assertTrue(self.manager.wait_until_idle(timeout=2))
+
+    def test_stop_drains_queue(self):
+        """Test that stop() drops queued texts so they are never spoken."""
+        self.manager.speak("One", mood_override="neutral")
+        self.assertTrue(self.started.wait(timeout=2))
+        self.manager.speak("Two", mood_override="neutral")
+        self.manager.speak("Three", mood_override="neutral")
+
+        self.manager.stop()
+
+        self.assertTrue(self.manager.queue.empty())
+        self.release.set()
+        self.assertTrue(self.manager.wait_until_idle(timeout=2))
+        self.assertEqual(self.spoken, ["One"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -4,10 +4,6 @@ PAN Version Information
 This module contains version information for the PAN application.
 """
 
-# pylint: disable=duplicate-code
-# The duplication with init_db.py and pan_core.py is intentional as these
-# are bootstrap modules that need to be able to run independently
-
 __version__ = "0.1.0"
 __author__ = "Kelsi Rae Davis"
 __email__ = "dumbandroid@gmail.com"